@@ -6,6 +6,7 @@ from datetime import date
 sys.path.append(str(Path(__file__).parent))
 
 from rig_tycoon.sim import Sim, SimConfig
+from rig_tycoon.models import Region
 
 def generate_saves():
     print("🔋 Generating sample save files...")
@@ -19,13 +20,13 @@ def generate_saves():
         sim.oil_market.step_month()
         sim.steel_market.step_month()
         tenders, sim.contract_id_seq = sim.contract_gen.generate_tick(
-            regions=["NORTH_SEA", "GOM"],
+            regions=[Region.NORTH_SEA, Region.GOM],
             next_contract_id=sim.contract_id_seq,
             as_of_date=test_date,
             oil_factor=sim.oil_market.oil_factor,
             demand_factor=sim.oil_market.demand_factor,
         )
-        sim._award_contracts(tenders)
+        sim._award_contracts(tenders, [])
         sim._settle_month_cashflows()
         sim._record_month()
         
@@ -1,21 +1,36 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from .models import Company, RigState
+from dataclasses import dataclass, field
+from .contracts import rig_matches_class
+from .models import Company, Rig, RigState
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .contracts import Tender
 
+_SCRAP = RigState.SCRAP
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AIPersonality:
     aggressiveness: float  # 0-1 (higher bids lower)
     desperation: float     # 0-1 (willing to bid below cost)
     quality_bias: float    # 0-1 (prefers high spec work)
 
+    # derived pricing constants, fixed for the personality's lifetime
+    discount_factor: float = field(init=False, repr=False, compare=False)
+    condition_weight: float = field(init=False, repr=False, compare=False)
+    desperation_shade_k: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # aggressiveness => larger discount off the operator's max dayrate
+        object.__setattr__(self, "discount_factor", 0.05 + 0.35 * self.aggressiveness)
+        # low quality_bias => prefer rigs closest to the required condition
+        object.__setattr__(self, "condition_weight", 1 - self.quality_bias)
+        # how far below break-even a desperate, cash-starved AI will go
+        object.__setattr__(self, "desperation_shade_k", int(5 * self.desperation))
+
 
-def estimate_break_even_dayrate_k(company: Company, rig_id: int, current_year: int) -> int:
-    rig = next(r for r in company.rigs if r.id == rig_id)
+def estimate_break_even_dayrate_k(rig: Rig, current_year: int) -> int:
     opex = rig.opex_per_day_k(current_year)
     # rough overhead + G&A
     overhead = 12
@@ -29,51 +44,53 @@ def choose_bid(company: Company, personality: AIPersonality, tender: Tender) ->
     """
     Returns (rig_id, dayrate_k) or None to not bid.
     """
+    spec = tender.spec
+    t_rig_class = spec.rig_type
+    t_region = spec.region
+    min_condition = spec.min_condition
+    max_dayrate = spec.max_dayrate
+    desperation = personality.desperation
     # use tender start date as the "year" for bidding decisions
-    current_year = tender.spec.start_date.year
-
-    # pick best available rig for spec/region/type
-    candidates = []
-    for rig in company.rigs:
-        if not rig.is_available:
-            continue
-        if rig.state == RigState.SCRAP:
-            continue
-        from .contracts import rig_matches_class
-        if not rig_matches_class(rig.rig_type, tender.spec.rig_type):
-            continue
-        if rig.region != tender.spec.region:
-            continue
-        if rig.condition < tender.spec.min_condition:
-            continue
-        candidates.append(rig)
-
-    if not candidates:
-        return None
+    current_year = spec.start_date.year
 
+    # pick best available rig for spec/region/type in a single pass;
     # prefer closer-to-required condition unless quality_bias high
-    candidates.sort(key=lambda r: (abs(r.condition - tender.spec.min_condition) * (1 - personality.quality_bias), -r.condition))
-    rig = candidates[0]
+    condition_weight = personality.condition_weight
+    rig = min(
+        (
+            r for r in company.rigs
+            if r.region is t_region
+            and r.is_available
+            and r.state is not _SCRAP
+            and rig_matches_class(r.rig_type, t_rig_class)
+            and r.condition >= min_condition
+        ),
+        key=lambda r: (abs(r.condition - min_condition) * condition_weight, -r.condition),
+        default=None,
+    )
+    if rig is None:
+        return None
 
-    breakeven = estimate_break_even_dayrate_k(company, rig.id, current_year)
+    breakeven = estimate_break_even_dayrate_k(rig, current_year)
 
     # AI pricing: start from max willingness and shade down
     # aggressiveness => larger discount
-    discount = int((0.05 + 0.35 * personality.aggressiveness) * tender.spec.max_dayrate)
-    bid = tender.spec.max_dayrate - discount
+    discount = int(personality.discount_factor * max_dayrate)
+    bid = max_dayrate - discount
 
     # if cash is low and rigs idle, can bid close to break-even or below (desperation)
-    if company.cash_musd < 25:
+    cash_musd = company.cash_musd
+    if cash_musd < 25:
         bid = min(bid, breakeven + 8)
 
-    if personality.desperation > 0.6 and company.cash_musd < 15:
-        bid = min(bid, breakeven - int(5 * personality.desperation))
+    if desperation > 0.6 and cash_musd < 15:
+        bid = min(bid, breakeven - personality.desperation_shade_k)
 
     # never bid above max
-    bid = min(bid, tender.spec.max_dayrate)
+    bid = min(bid, max_dayrate)
 
     # optionally skip bad economics
-    if bid < breakeven - 10 and personality.desperation < 0.5:
+    if bid < breakeven - 10 and desperation < 0.5:
         return None
 
     return (rig.id, max(1, bid))
@@ -88,10 +105,9 @@ def suggest_bid(company: Company, tender: Tender) -> dict:
     # We'll pick the 'best' rig for this tender to show as example breakeven
     candidates = []
     for rig in company.rigs:
-        from .contracts import rig_matches_class
         if not rig_matches_class(rig.rig_type, tender.spec.rig_type):
             continue
-        if rig.region != tender.spec.region:
+        if rig.region is not tender.spec.region:
             continue
         candidates.append(rig)
         
@@ -102,7 +118,7 @@ def suggest_bid(company: Company, tender: Tender) -> dict:
     candidates.sort(key=lambda r: r.opex_per_day_k(current_year))
     best_rig = candidates[0]
     
-    breakeven = estimate_break_even_dayrate_k(company, best_rig.id, current_year)
+    breakeven = estimate_break_even_dayrate_k(best_rig, current_year)
     
     # Range: from slightly above breakeven to tender max
     low_bid = max(breakeven + 5, tender.spec.min_dayrate)
@@ -1,13 +1,35 @@
 import argparse
+import atexit
 import sys
+from typing import Callable
+from .ai import suggest_bid
+from .models import RigState, Region
 from .sim import Sim, SimConfig
 
 
+_STATE_MAP = {"active": RigState.ACTIVE, "warm": RigState.WARM, "cold": RigState.COLD}
+
+_FLEET_HDR = f"{'ID':<5} {'Type':<10} {'Region':<12} {'Status':<12} {'Months':<8} {'Dayrate':<10} {'Opex':<8} {'Cond'}"
+_FLEET_SEP = "-" * 80
+_FLEET_ROW = "{id:<5} {type:<10} {region:<12} {status:<12} {months:<8} {dayrate:<10} ${opex:<7} {cond}%"
+_TENDERS_HDR = f"{'ID':<5} {'Type':<12} {'Region':<12} {'Rig Class':<18} {'Term':<6} {'Cond':<6} {'Dayrate Range':<15}"
+_TENDERS_SEP = "-" * 85
+_MARKET_HDR = f"{'ID':<5} {'Type':<10} {'Region':<12} {'Year':<6} {'Cond':<6} {'Price':<10}"
+_MARKET_SEP = "-" * 55
+_AWARDS_HDR = f"{'Tender':<8} {'Region':<12} {'Winner':<20} {'Rig':<6} {'Dayrate':<10} {'Term':<6}"
+_AWARDS_SEP = "-" * 65
+_COMPANIES_HDR = f"{'Name':<22} {'Cash':<10} {'Rigs':<6} {'Revenue':<12} {'Rep':<6}"
+_COMPANIES_SEP = "-" * 60
+
+
+def _write_rows(rows: list[str]) -> None:
+    """Emit a table in a single write instead of one print() per row."""
+    sys.stdout.write("\n".join(rows) + "\n")
+
+
 def print_fleet(sim: Sim):
     fleet = sim.get_company_fleet()
-    print("\n🚢 YOUR FLEET")
-    print(f"{'ID':<5} {'Type':<10} {'Region':<12} {'Status':<12} {'Months':<8} {'Dayrate':<10} {'Opex':<8} {'Cond'}")
-    print("-" * 80)
+    rows = ["", "🚢 YOUR FLEET", _FLEET_HDR, _FLEET_SEP]
     for r in fleet:
         status = r["state"].upper()
         region_str = r["region"]
@@ -17,68 +39,76 @@ def print_fleet(sim: Sim):
             
         months = r["on_contract_months_left"] if r["on_contract_months_left"] > 0 else "-"
         dayrate = f"${r['contract_dayrate_k']}k" if r["contract_dayrate_k"] > 0 else "-"
-        print(f"{r['id']:<5} {r['type']:<10} {region_str:<12} {status:<12} {months:<8} {dayrate:<10} ${r['monthly_opex_k']:<7} {r['condition']}%")
+        rows.append(_FLEET_ROW.format_map({
+            "id": r["id"],
+            "type": r["type"],
+            "region": region_str,
+            "status": status,
+            "months": months,
+            "dayrate": dayrate,
+            "opex": r["monthly_opex_k"],
+            "cond": r["condition"],
+        }))
+    _write_rows(rows)
 
 
 def print_tenders(sim: Sim):
     tenders = sim.get_open_tenders()
-    print("\n📝 OPEN TENDERS")
-    print(f"{'ID':<5} {'Type':<12} {'Region':<12} {'Rig Class':<18} {'Term':<6} {'Cond':<6} {'Dayrate Range':<15}")
-    print("-" * 85)
-    from .ai import suggest_bid
-    for t in tenders:
+    rows = ["", "📝 OPEN TENDERS", _TENDERS_HDR, _TENDERS_SEP]
+    # get_open_tenders() preserves the order of sim.current_tenders
+    for i, t in enumerate(tenders):
         spec = t["spec"]
         dr_range = f"${spec['min_dayrate']}-{spec['max_dayrate']}k"
-        print(f"{t['id']:<5} {spec['contract_type']:<12} {spec['region']:<12} {spec['rig_type']:<18} {spec['months']:<6} {spec['min_condition']}% {dr_range:<15}")
+        rows.append(f"{t['id']:<5} {spec['contract_type']:<12} {spec['region']:<12} {spec['rig_type']:<18} {spec['months']:<6} {spec['min_condition']}% {dr_range:<15}")
         
         # Suggested bid helper
-        suggestion = suggest_bid(sim.player, sim.current_tenders[tenders.index(t)])
+        suggestion = suggest_bid(sim.player, sim.current_tenders[i])
         if "error" not in suggestion:
-            print(f"      💡 Suggestion: Rig {suggestion['best_rig_id']} | Breakeven ${suggestion['breakeven_k']}k | Range ${suggestion['suggested_min_k']}-${suggestion['suggested_max_k']}k")
+            rows.append(f"      💡 Suggestion: Rig {suggestion['best_rig_id']} | Breakeven ${suggestion['breakeven_k']}k | Range ${suggestion['suggested_min_k']}-${suggestion['suggested_max_k']}k")
+    _write_rows(rows)
 
 
 def print_market(sim: Sim):
     market = sim.current_rigs_for_sale
-    print("\n🚢 RIG MARKET (SECOND-HAND)")
+    rows = ["", "🚢 RIG MARKET (SECOND-HAND)"]
     if not market:
-        print("No rigs currently for sale.")
+        rows.append("No rigs currently for sale.")
+        _write_rows(rows)
         return
-    print(f"{'ID':<5} {'Type':<10} {'Region':<12} {'Year':<6} {'Cond':<6} {'Price':<10}")
-    print("-" * 55)
+    rows += [_MARKET_HDR, _MARKET_SEP]
     for fs in market:
         r = fs.rig
-        print(f"{r.id:<5} {r.rig_type.value:<10} {r.region.value:<12} {r.build_year:<6} {r.condition:<6} ${fs.price_musd:0.1f}m")
+        rows.append(f"{r.id:<5} {r.rig_type.value:<10} {r.region.value:<12} {r.build_year:<6} {r.condition:<6} ${fs.price_musd:0.1f}m")
+    _write_rows(rows)
 
 
 def print_awards(awards: list[dict]):
-    print("\n🏆 AUCTION RESULTS")
+    rows = ["", "🏆 AUCTION RESULTS"]
     if not awards:
-        print("No contracts were awarded this month.")
+        rows.append("No contracts were awarded this month.")
+        _write_rows(rows)
         return
-    print(f"{'Tender':<8} {'Region':<12} {'Winner':<20} {'Rig':<6} {'Dayrate':<10} {'Term':<6}")
-    print("-" * 65)
+    rows += [_AWARDS_HDR, _AWARDS_SEP]
     for a in awards:
-        print(f"{a['tender_id']:<8} {a['region']:<12} {a['winner']:<20} {a['rig_id']:<6} ${a['dayrate_k']:<10} {a['months']}m")
+        rows.append(f"{a['tender_id']:<8} {a['region']:<12} {a['winner']:<20} {a['rig_id']:<6} ${a['dayrate_k']:<10} {a['months']}m")
+    _write_rows(rows)
 
 
 def print_companies(sim: Sim):
-    print("\n🏢 COMPANY OVERVIEW")
-    print(f"{'Name':<22} {'Cash':<10} {'Rigs':<6} {'Revenue':<12} {'Rep':<6}")
-    print("-" * 60)
+    rows = ["", "🏢 COMPANY OVERVIEW", _COMPANIES_HDR, _COMPANIES_SEP]
     for c in sim.all_companies:
         fin = sim.get_company_finances(c.name)
         active_rigs = [r for r in c.rigs if r.on_contract_months_left > 0]
         rig_count_str = f"{len(active_rigs)}/{len(c.rigs)}"
-        print(f"{c.name:<22} ${fin['cash_musd']:<9.1f} {rig_count_str:<6} ${fin['revenue_musd_month']:<11.2f} {c.reputation:0.2f}")
+        rows.append(f"{c.name:<22} ${fin['cash_musd']:<9.1f} {rig_count_str:<6} ${fin['revenue_musd_month']:<11.2f} {c.reputation:0.2f}")
+    _write_rows(rows)
 
 
 def print_regions():
-    from .models import Region
-    print("\n🌍 GLOBAL DRILLING REGIONS")
-    print(f"{'Name':<20} {'ID'}")
-    print("-" * 35)
+    rows = ["", "🌍 GLOBAL DRILLING REGIONS", f"{'Name':<20} {'ID'}", "-" * 35]
     for reg in Region:
-        print(f"{reg.name:<20} {reg.value}")
+        rows.append(f"{reg.name:<20} {reg.value}")
+    _write_rows(rows)
 
 
 def print_status(sim: Sim):
@@ -99,6 +129,309 @@ def print_status(sim: Sim):
     print(cash_line)
 
 
+PlayerBids = list[tuple[int, int, int]]
+
+
+def _report(success: bool, msg: str) -> None:
+    print(f"✅ {msg}" if success else f"❌ {msg}")
+
+
+# ======================
+# Command handlers
+# ======================
+# Each handler takes (sim, parts, player_bids). Returning True ends the session.
+
+def _cmd_next(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    awards = sim.resolve_turn(player_bids)
+    print("\n" + "="*40 + "\nADVANCING TO NEXT MONTH\n" + "="*40)
+    print_awards(awards)
+
+    player_bids.clear()
+    if sim.player.cash_musd <= 0:
+        print("\n💥 BANKRUPT. Game over.\n")
+        return True
+    sim.prepare_turn()
+
+
+def _cmd_bid(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 3:
+        print("❌ Usage: bid <tender_id> <rig_id> <rate_k>  (or: bid <tender_id> <rate_k> if you only have one eligible rig)")
+        return
+    try:
+        # Case: bid <t_id> <rate> (3 parts)
+        if len(parts) == 3:
+            t_id = int(parts[1])
+            rate = int(parts[2])
+
+            tender = sim.get_tender(t_id)
+            if not tender:
+                print(f"❌ Tender {t_id} not found.")
+                return
+
+            # Find eligible rigs (validate each rig once, keep the reasons)
+            checked = [(r, *sim.validate_bid(tender, r)) for r in sim.player.rigs]
+            eligible = [r for r, valid, _ in checked if valid]
+
+            if len(eligible) == 0:
+                print(f"❌ You have no eligible rigs for Tender {t_id}.")
+                # Show why?
+                for r, _, reason in checked:
+                    print(f"   - Rig {r.id}: {reason}")
+                return
+            elif len(eligible) > 1:
+                print(f"❌ Multiple rigs are eligible ({[r.id for r in eligible]}). Please specify: bid {t_id} <rig_id> {rate}")
+                return
+            else:
+                r_id = eligible[0].id
+                rig = eligible[0]
+        else:
+            # Case: bid <t_id> <r_id> <rate> (4 parts)
+            t_id = int(parts[1])
+            r_id = int(parts[2])
+            rate = int(parts[3])
+
+            tender = sim.get_tender(t_id)
+            rig = next((r for r in sim.player.rigs if r.id == r_id), None)
+
+            if not tender:
+                print(f"❌ Tender {t_id} not found.")
+                return
+            if not rig:
+                print(f"❌ Rig {r_id} not found in your fleet.")
+                return
+
+            valid, reason = sim.validate_bid(tender, rig)
+            if not valid:
+                print(f"❌ Invalid bid: {reason}")
+                return
+
+        # Check if rate is within reason
+        if rate > tender.spec.max_dayrate:
+            print(f"⚠️ Warning: Bid ${rate}k exceeds operator's max willingness of ${tender.spec.max_dayrate}k. You will likely lose.")
+
+        # Replace if already bid on this tender
+        player_bids[:] = [b for b in player_bids if b[0] != t_id]
+        player_bids.append((t_id, r_id, rate))
+        print(f"✅ Bid recorded: Rig {r_id} on Tender {t_id} for ${rate}k/day")
+
+    except ValueError:
+        print("❌ IDs and rate must be integers.")
+
+
+def _cmd_buy(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 2:
+        print("❌ Usage: buy <rig_id>")
+        return
+    try:
+        r_id = int(parts[1])
+        _report(*sim.buy_rig(r_id))
+    except ValueError:
+        print("❌ Rig ID must be an integer.")
+
+
+def _cmd_stack(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 3:
+        print("❌ Usage: stack <rig_id> <warm|cold>")
+        return
+    try:
+        r_id = int(parts[1])
+        if parts[2] not in _STATE_MAP:
+            print("❌ State must be 'active', 'warm' or 'cold'.")
+            return
+        _report(*sim.update_rig_state(r_id, _STATE_MAP[parts[2]]))
+    except ValueError:
+        print("❌ Rig ID must be an integer.")
+
+
+def _cmd_reactivate(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 2:
+        print("❌ Usage: reactivate <rig_id>")
+        return
+    try:
+        r_id = int(parts[1])
+        # Find current rig to see what we're reactivating FROM
+        rig = next((r for r in sim.player.rigs if r.id == r_id), None)
+        if not rig:
+            print(f"❌ Rig {r_id} not found.")
+            return
+
+        # If warm, move to active. If cold, move to warm.
+        target_state = RigState.ACTIVE if rig.state == RigState.WARM else RigState.WARM
+        _report(*sim.update_rig_state(r_id, target_state))
+    except ValueError:
+        print("❌ Rig ID must be an integer.")
+
+
+def _cmd_mobilize(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 3:
+        print("❌ Usage: mobilize <rig_id> <region>")
+        print("   Regions: north_sea, gom, brazil, west_africa, southeast_asia, australia")
+        return
+    try:
+        r_id = int(parts[1])
+        try:
+            target_reg = Region(parts[2])
+        except ValueError:
+            print(f"❌ Invalid region. Choose from: {[reg.value for reg in Region]}")
+            return
+
+        _report(*sim.mobilize_rig(r_id, target_reg))
+    except ValueError:
+        print("❌ Rig ID must be an integer.")
+
+
+def _cmd_scrap(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 2:
+        print("❌ Usage: scrap <rig_id>")
+        return
+    try:
+        r_id = int(parts[1])
+        # Double confirm?
+        confirm = input(f"Are you sure you want to scrap Rig {r_id}? (y/n): ").strip().lower()
+        if confirm == 'y':
+            _report(*sim.scrap_rig(r_id))
+    except ValueError:
+        print("❌ Rig ID must be an integer.")
+
+
+def _cmd_loan(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 2:
+        info = sim.get_loan_info()
+        print(f"🏦 BANK OF OFFSHORE")
+        print(f"   Current Debt: ${info['current_debt']:0.1f}m")
+        print(f"   Borrow Limit: ${info['max_debt']:0.1f}m")
+        print(f"   Available:    ${info['available']:0.1f}m")
+        print(f"   Interest:     1.0% monthly")
+        print("\n   Usage: loan <amount>")
+        return
+    try:
+        amt = float(parts[1])
+        _report(*sim.take_loan(amt))
+    except ValueError:
+        print("❌ Amount must be a number.")
+
+
+def _cmd_repay(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    if len(parts) < 2:
+        print("❌ Usage: repay <amount>")
+        return
+    try:
+        amt = float(parts[1])
+        _report(*sim.repay_loan(amt))
+    except ValueError:
+        print("❌ Amount must be a number.")
+
+
+def _cmd_save(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    path = parts[1] if len(parts) > 1 else "quicksave.json"
+    sim.save(path)
+
+
+def _cmd_help(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    print("\n📈 VIEWS")
+    print("  fleet            - View your rigs, status, and opex")
+    print("  tenders          - View open contracts and suggested bids")
+    print("  market           - View second-hand rigs available for sale")
+    print("  companies        - Compare cash, rigs, and rep of all firms")
+    print("  regions          - List global regions and their IDs")
+
+    print("\n🚀 ACTIONS")
+    print("  next             - Advance to next month (resolves bids)")
+    print("  bid ...          - bid <t_id> <r_id> <rate> or bid <t_id> <rate>")
+    print("  stack <id> <st>  - Move rig to 'active', 'warm' or 'cold'")
+    print("  reactivate <id>  - Move cold rig to warm, or warm to active")
+    print("  mobilize <id> <rg> - Move rig to another region ($2.5m, 1m transit)")
+    print("  buy <id>         - Purchase a rig from the market")
+    print("  scrap <id>       - Sell a rig for scrap value")
+    print("  loan [amt]       - Take out a bank loan (view info or borrow)")
+    print("  repay <amt>      - Repay debt to the bank")
+    print("  save [path]      - Save current simulation state")
+    print("  quit             - Exit game")
+
+
+def _cmd_quit(sim: Sim, parts: list[str], player_bids: PlayerBids) -> bool | None:
+    return True
+
+
+_COMMANDS = {
+    "next": _cmd_next,
+    "fleet": lambda sim, parts, player_bids: print_fleet(sim),
+    "tenders": lambda sim, parts, player_bids: print_tenders(sim),
+    "bid": _cmd_bid,
+    "market": lambda sim, parts, player_bids: print_market(sim),
+    "companies": lambda sim, parts, player_bids: print_companies(sim),
+    "regions": lambda sim, parts, player_bids: print_regions(),
+    "buy": _cmd_buy,
+    "stack": _cmd_stack,
+    "reactivate": _cmd_reactivate,
+    "mobilize": _cmd_mobilize,
+    "scrap": _cmd_scrap,
+    "loan": _cmd_loan,
+    "repay": _cmd_repay,
+    "save": _cmd_save,
+    "help": _cmd_help,
+    "quit": _cmd_quit,
+}
+
+
+# command history, kept across sessions
+_HISTORY_FILE = ".rt_history"
+
+
+def _setup_readline(verbs: list[str]) -> None:
+    """
+    Fallback line editing via the stdlib readline module, where available
+    (not on stock Windows Python): verb completion plus persistent history.
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+
+    def complete(text: str, state: int) -> str | None:
+        matches = [v for v in verbs if v.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+
+    try:
+        readline.read_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+
+    def save_history() -> None:
+        try:
+            readline.write_history_file(_HISTORY_FILE)
+        except OSError:
+            pass
+
+    atexit.register(save_history)
+
+
+def _make_line_reader() -> Callable[[str], str]:
+    """
+    Returns the prompt function for the command loop. On a terminal that is a
+    prompt_toolkit session with persistent history and tab-completion of
+    command verbs; readline-backed input() if prompt_toolkit is missing;
+    plain input() when stdin is piped.
+    """
+    if not sys.stdin.isatty():
+        return input
+
+    verbs = sorted(_COMMANDS)
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.completion import WordCompleter
+        from prompt_toolkit.history import FileHistory
+    except ImportError:
+        _setup_readline(verbs)
+        return input
+
+    session = PromptSession(history=FileHistory(_HISTORY_FILE), completer=WordCompleter(verbs))
+    return session.prompt
+
+
 def main() -> None:
     p = argparse.ArgumentParser()
     p.add_argument("--months", type=int, default=36)
@@ -113,7 +446,9 @@ def main() -> None:
         sim = Sim(SimConfig(seed=args.seed, months=args.months))
         print("🚀 Starting new simulation")
 
-    player_bids = []
+    read_command = _make_line_reader()
+
+    player_bids: PlayerBids = []
     
     # Initial tenders
     sim.prepare_turn()
@@ -122,264 +457,18 @@ def main() -> None:
         print_status(sim)
         print("\nVIEWS:   fleet, tenders, market, companies, regions")
         print("ACTIONS: next, bid, stack, reactivate, mobilize, buy, scrap, loan, repay, save, help, quit")
-        cmd_raw = input("> ").strip().lower()
+        cmd_raw = read_command("> ").strip().lower()
         if not cmd_raw:
             continue
             
         parts = cmd_raw.split()
         cmd = parts[0]
 
-        if cmd == "next":
-            awards = sim.resolve_turn(player_bids)
-            print("\n" + "="*40 + "\nADVANCING TO NEXT MONTH\n" + "="*40)
-            print_awards(awards)
-            
-            player_bids = []
-            if sim.player.cash_musd <= 0:
-                print("\n💥 BANKRUPT. Game over.\n")
-                break
-            sim.prepare_turn()
-        elif cmd == "fleet":
-            print_fleet(sim)
-            
-        elif cmd == "tenders":
-            print_tenders(sim)
-            
-        elif cmd == "bid":
-            if len(parts) < 3:
-                print("❌ Usage: bid <tender_id> <rig_id> <rate_k>  (or: bid <tender_id> <rate_k> if you only have one eligible rig)")
-                continue
-            try:
-                # Case: bid <t_id> <rate> (3 parts)
-                if len(parts) == 3:
-                    t_id = int(parts[1])
-                    rate = int(parts[2])
-                    
-                    tender = next((t for t in sim.current_tenders if t.id == t_id), None)
-                    if not tender:
-                        print(f"❌ Tender {t_id} not found.")
-                        continue
-                        
-                    # Find eligible rigs
-                    eligible = []
-                    for r in sim.player.rigs:
-                        valid, _ = sim.validate_bid(tender, r)
-                        if valid:
-                            eligible.append(r)
-                            
-                    if len(eligible) == 0:
-                        print(f"❌ You have no eligible rigs for Tender {t_id}.")
-                        # Show why?
-                        for r in sim.player.rigs:
-                            _, reason = sim.validate_bid(tender, r)
-                            print(f"   - Rig {r.id}: {reason}")
-                        continue
-                    elif len(eligible) > 1:
-                        print(f"❌ Multiple rigs are eligible ({[r.id for r in eligible]}). Please specify: bid {t_id} <rig_id> {rate}")
-                        continue
-                    else:
-                        r_id = eligible[0].id
-                        rig = eligible[0]
-                else:
-                    # Case: bid <t_id> <r_id> <rate> (4 parts)
-                    t_id = int(parts[1])
-                    r_id = int(parts[2])
-                    rate = int(parts[3])
-                    
-                    tender = next((t for t in sim.current_tenders if t.id == t_id), None)
-                    rig = next((r for r in sim.player.rigs if r.id == r_id), None)
-                    
-                    if not tender:
-                        print(f"❌ Tender {t_id} not found.")
-                        continue
-                    if not rig:
-                        print(f"❌ Rig {r_id} not found in your fleet.")
-                        continue
-                        
-                    valid, reason = sim.validate_bid(tender, rig)
-                    if not valid:
-                        print(f"❌ Invalid bid: {reason}")
-                        continue
-                
-                # Check if rate is within reason
-                if rate > tender.spec.max_dayrate:
-                    print(f"⚠️ Warning: Bid ${rate}k exceeds operator's max willingness of ${tender.spec.max_dayrate}k. You will likely lose.")
-                
-                # Replace if already bid on this tender
-                player_bids = [b for b in player_bids if b[0] != t_id]
-                player_bids.append((t_id, r_id, rate))
-                print(f"✅ Bid recorded: Rig {r_id} on Tender {t_id} for ${rate}k/day")
-                
-            except ValueError:
-                print("❌ IDs and rate must be integers.")
-                
-        elif cmd == "market":
-            print_market(sim)
-            
-        elif cmd == "companies":
-            print_companies(sim)
-            
-        elif cmd == "regions":
-            print_regions()
-            
-        elif cmd == "buy":
-            if len(parts) < 2:
-                print("❌ Usage: buy <rig_id>")
-                continue
-            try:
-                r_id = int(parts[1])
-                success, msg = sim.buy_rig(r_id)
-                if success:
-                    print(f"✅ {msg}")
-                else:
-                    print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Rig ID must be an integer.")
-                
-        elif cmd == "stack":
-            if len(parts) < 3:
-                print("❌ Usage: stack <rig_id> <warm|cold>")
-                continue
-            try:
-                r_id = int(parts[1])
-                from .models import RigState
-                state_map = {"active": RigState.ACTIVE, "warm": RigState.WARM, "cold": RigState.COLD}
-                if parts[2] not in state_map:
-                    print("❌ State must be 'active', 'warm' or 'cold'.")
-                    continue
-                success, msg = sim.update_rig_state(r_id, state_map[parts[2]])
-                if success:
-                    print(f"✅ {msg}")
-                else:
-                    print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Rig ID must be an integer.")
-
-        elif cmd == "reactivate":
-            if len(parts) < 2:
-                print("❌ Usage: reactivate <rig_id>")
-                continue
-            try:
-                r_id = int(parts[1])
-                from .models import RigState
-                # Find current rig to see what we're reactivating FROM
-                rig = next((r for r in sim.player.rigs if r.id == r_id), None)
-                if not rig:
-                    print(f"❌ Rig {r_id} not found.")
-                    continue
-                
-                # If warm, move to active. If cold, move to warm.
-                target_state = RigState.ACTIVE if rig.state == RigState.WARM else RigState.WARM
-                success, msg = sim.update_rig_state(r_id, target_state)
-                if success:
-                    print(f"✅ {msg}")
-                else:
-                    print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Rig ID must be an integer.")
-
-        elif cmd == "mobilize":
-            if len(parts) < 3:
-                print("❌ Usage: mobilize <rig_id> <region>")
-                print("   Regions: north_sea, gom, brazil, west_africa, southeast_asia, australia")
-                continue
-            try:
-                r_id = int(parts[1])
-                from .models import Region
-                try:
-                    target_reg = Region(parts[2])
-                except ValueError:
-                    print(f"❌ Invalid region. Choose from: {[reg.value for reg in Region]}")
-                    continue
-                    
-                success, msg = sim.mobilize_rig(r_id, target_reg)
-                if success:
-                    print(f"✅ {msg}")
-                else:
-                    print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Rig ID must be an integer.")
-
-        elif cmd == "scrap":
-            if len(parts) < 2:
-                print("❌ Usage: scrap <rig_id>")
-                continue
-            try:
-                r_id = int(parts[1])
-                # Double confirm?
-                confirm = input(f"Are you sure you want to scrap Rig {r_id}? (y/n): ").strip().lower()
-                if confirm == 'y':
-                    success, msg = sim.scrap_rig(r_id)
-                    if success:
-                        print(f"✅ {msg}")
-                    else:
-                        print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Rig ID must be an integer.")
-
-        elif cmd == "loan":
-            if len(parts) < 2:
-                info = sim.get_loan_info()
-                print(f"🏦 BANK OF OFFSHORE")
-                print(f"   Current Debt: ${info['current_debt']:0.1f}m")
-                print(f"   Borrow Limit: ${info['max_debt']:0.1f}m")
-                print(f"   Available:    ${info['available']:0.1f}m")
-                print(f"   Interest:     1.0% monthly")
-                print("\n   Usage: loan <amount>")
-                continue
-            try:
-                amt = float(parts[1])
-                success, msg = sim.take_loan(amt)
-                if success:
-                    print(f"✅ {msg}")
-                else:
-                    print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Amount must be a number.")
-
-        elif cmd == "repay":
-            if len(parts) < 2:
-                print("❌ Usage: repay <amount>")
-                continue
-            try:
-                amt = float(parts[1])
-                success, msg = sim.repay_loan(amt)
-                if success:
-                    print(f"✅ {msg}")
-                else:
-                    print(f"❌ {msg}")
-            except ValueError:
-                print("❌ Amount must be a number.")
-
-        elif cmd == "save":
-            path = parts[1] if len(parts) > 1 else "quicksave.json"
-            sim.save(path)
-            
-        elif cmd == "help":
-            print("\n📈 VIEWS")
-            print("  fleet            - View your rigs, status, and opex")
-            print("  tenders          - View open contracts and suggested bids")
-            print("  market           - View second-hand rigs available for sale")
-            print("  companies        - Compare cash, rigs, and rep of all firms")
-            print("  regions          - List global regions and their IDs")
-            
-            print("\n🚀 ACTIONS")
-            print("  next             - Advance to next month (resolves bids)")
-            print("  bid ...          - bid <t_id> <r_id> <rate> or bid <t_id> <rate>")
-            print("  stack <id> <st>  - Move rig to 'active', 'warm' or 'cold'")
-            print("  reactivate <id>  - Move cold rig to warm, or warm to active")
-            print("  mobilize <id> <rg> - Move rig to another region ($2.5m, 1m transit)")
-            print("  buy <id>         - Purchase a rig from the market")
-            print("  scrap <id>       - Sell a rig for scrap value")
-            print("  loan [amt]       - Take out a bank loan (view info or borrow)")
-            print("  repay <amt>      - Repay debt to the bank")
-            print("  save [path]      - Save current simulation state")
-            print("  quit             - Exit game")
-            
-        elif cmd == "quit":
-            break
-        else:
+        handler = _COMMANDS.get(cmd)
+        if handler is None:
             print(f"❓ Unknown command: {cmd}")
+        elif handler(sim, parts, player_bids):
+            break
 
     sim.finalize()
     print("\n📊 Simulation finished.")
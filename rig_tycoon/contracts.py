@@ -1,8 +1,12 @@
+from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
 from datetime import date
+from bisect import bisect_left
+from itertools import accumulate
+from math import sqrt
 import random
-import calendar
+from types import MappingProxyType
 from typing import Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,11 +21,18 @@ else:
 # Helpers
 # -----------------------------
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(y: int) -> bool:
+    return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+
+
 def add_months(d: date, months: int) -> date:
     """Add months to a date, clamping day-of-month to last day where needed."""
     y = d.year + (d.month - 1 + months) // 12
     m = (d.month - 1 + months) % 12 + 1
-    last = calendar.monthrange(y, m)[1]
+    last = 29 if m == 2 and _is_leap(y) else _DAYS_IN_MONTH[m - 1]
     return date(y, m, min(d.day, last))
 
 
@@ -29,6 +40,22 @@ def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
+def _triangular_inv_cdf(low: float, mode: float, high: float) -> tuple:
+    """(low, high, span, mode fraction, 1 - mode fraction) for an inverse-CDF triangular draw."""
+    span = high - low
+    if span == 0:
+        # degenerate (low == high): both branches give low, after consuming the
+        # one draw, as random.triangular does
+        return (low, high, 0, 0.0, 1.0)
+    f = (mode - low) / span
+    return (low, high, span, f, 1.0 - f)
+
+
+def cumulative_weights(weights: dict) -> tuple[tuple, tuple[float, ...], float]:
+    """Precompute (items, running totals, total) for weighted picks via bisect."""
+    return tuple(weights), tuple(accumulate(weights.values())), sum(weights.values())
+
+
 # -----------------------------
 # Schema
 # -----------------------------
@@ -52,39 +79,48 @@ class PositioningRequired(Enum):
     DP_REQUIRED = auto()
 
 
+_RIG_TYPES_FOR_CLASS: dict[RigClassRequired, frozenset[RigType]] = {
+    RigClassRequired.JACKUP: frozenset({RigType.JACKUP}),
+    RigClassRequired.SEMI: frozenset({RigType.SEMI}),
+    RigClassRequired.DRILLSHIP: frozenset({RigType.DRILLSHIP}),
+    RigClassRequired.SEMI_OR_DRILLSHIP: frozenset({RigType.SEMI, RigType.DRILLSHIP}),
+}
+
+
 def rig_matches_class(rig_type: RigType, req_class: RigClassRequired) -> bool:
-    if req_class == RigClassRequired.JACKUP:
-        return rig_type == RigType.JACKUP
-    if req_class == RigClassRequired.SEMI:
-        return rig_type == RigType.SEMI
-    if req_class == RigClassRequired.DRILLSHIP:
-        return rig_type == RigType.DRILLSHIP
-    if req_class == RigClassRequired.SEMI_OR_DRILLSHIP:
-        return rig_type in (RigType.SEMI, RigType.DRILLSHIP)
-    return False
-
-
-@dataclass(frozen=True)
+    types = _RIG_TYPES_FOR_CLASS.get(req_class)
+    return types is not None and rig_type in types
+
+
+# Enum member -> serialised name/value, resolved once instead of per to_dict call
+_CONTRACT_TYPE_NAMES = {m: m.name for m in ContractType}
+_RIG_CLASS_NAMES = {m: m.name for m in RigClassRequired}
+_POSITIONING_NAMES = {m: m.name for m in PositioningRequired}
+_REGION_VALUES = {m: m.value for m in Region}
+
+
+@dataclass(frozen=True, slots=True)
 class Tender:
     id: int
     spec: ContractSpec
 
     def to_dict(self) -> dict:
+        s = self.spec
         return {
             "id": self.id,
             "spec": {
-                "contract_type": self.spec.contract_type.name,
-                "region": self.spec.region.value,
-                "start_date": self.spec.start_date.isoformat(),
-                "months": self.spec.months,
-                "water_depth_m": self.spec.water_depth_m,
-                "harsh": self.spec.harsh,
-                "rig_type": self.spec.rig_type.name,
-                "positioning_required": self.spec.positioning_required.name,
-                "min_condition": self.spec.min_condition,
-                "min_dayrate": self.spec.min_dayrate,
-                "max_dayrate": self.spec.max_dayrate,
-                "early_termination_penalty_k": self.spec.early_termination_penalty_k,
+                "contract_type": _CONTRACT_TYPE_NAMES[s.contract_type],
+                "region": _REGION_VALUES[s.region],
+                "start_date": s.start_date.isoformat(),
+                "months": s.months,
+                "water_depth_m": s.water_depth_m,
+                "harsh": s.harsh,
+                "rig_type": _RIG_CLASS_NAMES[s.rig_type],
+                "positioning_required": _POSITIONING_NAMES[s.positioning_required],
+                "min_condition": s.min_condition,
+                "min_dayrate": s.min_dayrate,
+                "max_dayrate": s.max_dayrate,
+                "early_termination_penalty_k": s.early_termination_penalty_k,
             }
         }
 
@@ -108,7 +144,7 @@ class Tender:
         return cls(id=d["id"], spec=spec)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TenderSpec:
     contract_type: ContractType
     region: Region
@@ -123,11 +159,59 @@ class TenderSpec:
     max_dayrate: int
     early_termination_penalty_k: int
 
+    def __post_init__(self) -> None:
+        # plain region values ("gom") become members; bid filters compare regions by identity
+        object.__setattr__(self, "region", Region(self.region))
+
 
 # -----------------------------
 # Generator
 # -----------------------------
 
+# Read-only module defaults for ContractGenConfig; each config gets its own dict copy,
+# so per-instance edits (parameter sweeps) and copy.deepcopy keep working
+_DEFAULT_HARSH_PROB_BY_REGION = MappingProxyType({
+    Region.NORTH_SEA: 0.3,
+    Region.GOM: 0,
+})
+_DEFAULT_TYPE_WEIGHTS = MappingProxyType({
+    ContractType.WORKOVER: 0.25,
+    ContractType.DEVELOPMENT: 0.50,
+    ContractType.EXPLORATION: 0.25,
+})
+_DEFAULT_BASE_DAYRATE_K = MappingProxyType({
+    RigClassRequired.JACKUP: 120,
+    RigClassRequired.SEMI: 240,
+    RigClassRequired.DRILLSHIP: 300,
+    RigClassRequired.SEMI_OR_DRILLSHIP: 270,
+})
+_DEFAULT_WATER_DEPTH_TRIANGULAR_M = MappingProxyType({
+    ContractType.WORKOVER: (20, 60, 150),
+    ContractType.DEVELOPMENT: (30, 150, 800),
+    ContractType.EXPLORATION: (80, 400, 2500),
+})
+_DEFAULT_DURATION_CHOICES_MONTHS = MappingProxyType({
+    # short, punchy, frequent
+    ContractType.WORKOVER: (1, 2, 3, 4),
+    # the bread-and-butter
+    ContractType.DEVELOPMENT: (6, 9, 12, 18, 24),
+    # fewer, longer-ish, higher variance
+    ContractType.EXPLORATION: (3, 6, 9, 12),
+})
+
+
+# Months of early-termination penalty "coverage" per (type, harsh); harsh work adds a month
+_PENALTY_MONTHS = MappingProxyType({
+    (ctype, harsh): months + int(harsh)
+    for ctype, months in (
+        (ContractType.WORKOVER, 1),
+        (ContractType.EXPLORATION, 2),
+        (ContractType.DEVELOPMENT, 3),
+    )
+    for harsh in (False, True)
+})
+
+
 @dataclass
 class ContractGenConfig:
     # How many tenders per region per tick (before demand factor + noise)
@@ -156,80 +240,91 @@ class ContractGenConfig:
 
     def __post_init__(self) -> None:
         if self.harsh_prob_by_region is None:
-            self.harsh_prob_by_region = {
-                Region.NORTH_SEA: 0.3,
-                Region.GOM: 0,
-            }
+            self.harsh_prob_by_region = dict(_DEFAULT_HARSH_PROB_BY_REGION)
         if self.type_weights is None:
-            self.type_weights = {
-                ContractType.WORKOVER: 0.25,
-                ContractType.DEVELOPMENT: 0.50,
-                ContractType.EXPLORATION: 0.25,
-            }
+            self.type_weights = dict(_DEFAULT_TYPE_WEIGHTS)
         if self.base_dayrate_k is None:
-            self.base_dayrate_k = {
-                RigClassRequired.JACKUP: 120,
-                RigClassRequired.SEMI: 240,
-                RigClassRequired.DRILLSHIP: 300,
-                RigClassRequired.SEMI_OR_DRILLSHIP: 270,
-            }
+            self.base_dayrate_k = dict(_DEFAULT_BASE_DAYRATE_K)
         if self.water_depth_triangular_m is None:
-            self.water_depth_triangular_m = {
-                ContractType.WORKOVER: (20, 60, 150),
-                ContractType.DEVELOPMENT: (30, 150, 800),
-                ContractType.EXPLORATION: (80, 400, 2500),
-            }
+            self.water_depth_triangular_m = dict(_DEFAULT_WATER_DEPTH_TRIANGULAR_M)
         if self.duration_choices_months is None:
-            self.duration_choices_months = {
-                # short, punchy, frequent
-                ContractType.WORKOVER: (1, 2, 3, 4),
-                # the bread-and-butter
-                ContractType.DEVELOPMENT: (6, 9, 12, 18, 24),
-                # fewer, longer-ish, higher variance
-                ContractType.EXPLORATION: (3, 6, 9, 12),
-            }
+            self.duration_choices_months = dict(_DEFAULT_DURATION_CHOICES_MONTHS)
 
 
 class ContractGenerator:
     def __init__(self, rng: random.Random | None = None, cfg: ContractGenConfig | None = None):
         self.rng = rng or random.Random()
         self.cfg = cfg or ContractGenConfig()
+        self._refresh_tables()
+
+    def _refresh_tables(self) -> None:
+        """
+        Rebuild the lookup tables derived from cfg. Called at the start of every
+        generate_tick, so cfg edits (reassigned or in place) apply from the next tick.
+        """
+        cfg = self.cfg
+        self._type_weights_cum = cumulative_weights(cfg.type_weights)
+        self._water_depth_inv_cdf = {
+            ctype: _triangular_inv_cdf(*tri) for ctype, tri in cfg.water_depth_triangular_m.items()
+        }
+        # (harsh, dp, exploration multipliers, floor ratio) per (type, positioning, harsh);
+        # unused multipliers are 1.0 so chaining them keeps results bit-identical
+        self._dayrate_mults = {
+            (ctype, positioning, harsh): (
+                cfg.harsh_mult if harsh else 1.0,
+                cfg.dp_mult if positioning == PositioningRequired.DP_REQUIRED else 1.0,
+                1.05 if ctype == ContractType.EXPLORATION else 1.0,
+                0.70 if ctype == ContractType.EXPLORATION else 0.75,
+            )
+            for ctype in ContractType
+            for positioning in PositioningRequired
+            for harsh in (False, True)
+        }
 
-    def _pick_weighted(self, weights: dict[Enum, float]):
-        items = list(weights.items())
-        total = sum(w for _, w in items)
+    def _pick_weighted(self, table: tuple[tuple, tuple[float, ...], float]):
+        """Pick from a cumulative_weights() table."""
+        items, cum, total = table
         r = self.rng.random() * total
-        acc = 0.0
-        for item, w in items:
-            acc += w
-            if r <= acc:
-                return item
-        return items[-1][0]
+        idx = bisect_left(cum, r)
+        return items[idx] if idx < len(items) else items[-1]
 
     def _pick_harsh(self, region: Region) -> bool:
         p = self.cfg.harsh_prob_by_region.get(region, 0.10)
         return self.rng.random() < p
 
     def _water_depth(self, ctype: ContractType) -> int:
-        a, b, c = self.cfg.water_depth_triangular_m[ctype]
-        return int(self.rng.triangular(a, c, b))
+        # Inverse-CDF triangular draw; same arithmetic as random.triangular(a, c, b)
+        # but with the mode fraction precomputed per contract type.
+        low, high, span, f, g = self._water_depth_inv_cdf[ctype]
+        u = self.rng.random()
+        if u > f:
+            return int(high - span * sqrt((1.0 - u) * g))
+        return int(low + span * sqrt(u * f))
 
     def _duration_months(self, ctype: ContractType, harsh: bool) -> int:
         months = self.rng.choice(self.cfg.duration_choices_months[ctype])
         # Harsh work tends to carry a bit more committed time/admin drag
-        if harsh and ctype != ContractType.WORKOVER and self.rng.random() < 0.30:
-            months += 3
+        # (short-circuits, so the extra draw only happens for harsh non-workovers)
+        months += 3 * (harsh and ctype is not ContractType.WORKOVER and self.rng.random() < 0.30)
         return months
 
-    def _start_date(self, *, as_of_date: date) -> date:
+    def _start_date(
+        self,
+        *,
+        as_of_date: date,
+        first_of_month: date,
+        cache: dict[tuple[date, int], date],
+    ) -> date:
         # Simple: most contracts start now or soon; occasional 2–3 month lead
         lead_months = self.rng.choice(self.cfg.start_in_months_choices)
         # Prefer starts on the 1st (easy for monthly ticks), with rare mid-month
-        if self.rng.random() < 0.85:
-            base = date(as_of_date.year, as_of_date.month, 1)
-        else:
-            base = as_of_date
-        return add_months(base, lead_months)
+        base = first_of_month if self.rng.random() < 0.85 else as_of_date
+        # as_of_date is fixed per tick, so each (base, lead) pair is only computed once
+        key = (base, lead_months)
+        start = cache.get(key)
+        if start is None:
+            start = cache[key] = add_months(base, lead_months)
+        return start
 
     def _rig_class_and_positioning(
         self,
@@ -271,19 +366,11 @@ class ContractGenerator:
         contract_type: ContractType,
     ) -> tuple[int, int]:
         base = self.cfg.base_dayrate_k[rig_class]
-        mult = oil_factor
-
-        if harsh:
-            mult *= self.cfg.harsh_mult
-        if positioning == PositioningRequired.DP_REQUIRED:
-            mult *= self.cfg.dp_mult
-
         # Exploration has a touch more variance/optionality
-        if contract_type == ContractType.EXPLORATION:
-            mult *= 1.05
+        harsh_m, dp_m, type_m, floor_ratio = self._dayrate_mults[contract_type, positioning, harsh]
+        mult = oil_factor * harsh_m * dp_m * type_m
 
         max_k = max(40, int(base * mult))
-        floor_ratio = 0.70 if contract_type == ContractType.EXPLORATION else 0.75
         min_k = max(30, int(max_k * floor_ratio))
         if min_k >= max_k:
             min_k = max_k - 5
@@ -303,19 +390,8 @@ class ContractGenerator:
           penalty ≈ penalty_months * 30 days * max_dayrate
         Longer + harsher + development => stiffer penalties.
         """
-        # Months of penalty "coverage"
-        if contract_type == ContractType.WORKOVER:
-            penalty_months = 1
-        elif contract_type == ContractType.EXPLORATION:
-            penalty_months = 2
-        else:  # DEVELOPMENT
-            penalty_months = 3
-
-        if harsh:
-            penalty_months += 1
-
         # Cap penalty months relative to duration (avoid absurd penalties on 1–2 month workovers)
-        penalty_months = min(penalty_months, max(1, duration_months))
+        penalty_months = min(_PENALTY_MONTHS[contract_type, harsh], max(1, duration_months))
 
         penalty_k = int(dayrate_k_max * 30 * penalty_months)
         # Add a small admin/legal floor so penalties exist even if dayrates are low
@@ -331,10 +407,12 @@ class ContractGenerator:
         oil_factor: float = 1.0,       # 0.6 bust .. 1.4 boom
         demand_factor: float = 1.0,    # 0.5 low demand .. 1.8 high demand
     ) -> tuple[list[Tender], int]:
+        self._refresh_tables()
         out: list[Tender] = []
         cid = next_contract_id
 
-        regions_list = list(regions)
+        # indexed and sized below; lists/tuples (the usual case) are used as-is
+        regions_list = regions if isinstance(regions, (list, tuple)) else list(regions)
         
         # Target 0-3 contracts total per tick
         base_n = self.cfg.base_tenders_per_region * demand_factor * len(regions_list) # Scaled but we clamp
@@ -344,9 +422,12 @@ class ContractGenerator:
         n = int(round(val))
         n = max(0, min(3, n))
 
+        first_of_month = date(as_of_date.year, as_of_date.month, 1)
+        start_dates: dict[tuple[date, int], date] = {}
+
         for _ in range(n):
             region = self.rng.choice(regions_list)
-            ctype = self._pick_weighted(self.cfg.type_weights)
+            ctype = self._pick_weighted(self._type_weights_cum)
             harsh = self._pick_harsh(region)
             water_depth_m = self._water_depth(ctype)
 
@@ -356,7 +437,11 @@ class ContractGenerator:
             )
 
             duration_months = self._duration_months(ctype, harsh)
-            start = self._start_date(as_of_date=as_of_date)
+            start = self._start_date(
+                as_of_date=as_of_date,
+                first_of_month=first_of_month,
+                cache=start_dates,
+            )
 
             dayrate_k_min, dayrate_k_max = self._dayrate_range_k(
                 rig_class=rig_class,
@@ -444,7 +529,7 @@ if __name__ == "__main__":
     rng = random.Random(42)
     gen = ContractGenerator(rng=rng)
 
-    regions = ["NORTH_SEA", "GOM", "BRAZIL"]
+    regions = [Region.NORTH_SEA, Region.GOM, Region.BRAZIL]
     next_id = 1
     today = date(2025, 12, 1)
 
@@ -29,7 +29,19 @@ class Region(str, Enum):
         return self.value
 
 
-@dataclass(frozen=True)
+# Enum members bound once for the per-rig hot paths below
+_ACTIVE = RigState.ACTIVE
+_WARM = RigState.WARM
+_COLD = RigState.COLD
+_JACKUP = RigType.JACKUP
+
+# Saved value -> member, skipping Enum.__call__ when loading rigs
+_RIG_TYPE_BY_VALUE = {m.value: m for m in RigType}
+_RIG_STATE_BY_VALUE = {m.value: m for m in RigState}
+_REGION_BY_VALUE = {m.value: m for m in Region}
+
+
+@dataclass(frozen=True, slots=True)
 class ContractSpec:
     region: Region
     months: int
@@ -61,7 +73,7 @@ class ContractSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     id: int
     spec: ContractSpec
@@ -89,7 +101,7 @@ class Contract:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Rig:
     id: int
     rig_type: RigType
@@ -106,20 +118,28 @@ class Rig:
     transit_months_left: int = 0
     target_region: Optional[Region] = None
 
+    def __post_init__(self) -> None:
+        # callers may pass plain values ("gom"); store members, since the AI
+        # filters and state checks compare them by identity
+        self.rig_type = RigType(self.rig_type)
+        self.region = Region(self.region)
+        self.state = RigState(self.state)
+        if self.target_region is not None:
+            self.target_region = Region(self.target_region)
+
     def to_dict(self) -> dict:
+        # one literal for the always-present keys; model_id keeps its slot after id
         out = {
             "id": self.id,
-        }
-        if self.model_id is not None:
-            out["model_id"] = self.model_id
-            
-        out.update({
+            "model_id": self.model_id,
             "rig_type": self.rig_type.value,
             "build_year": self.build_year,
             "condition": self.condition,
             "region": self.region.value,
             "state": self.state.value,
-        })
+        }
+        if self.model_id is None:
+            del out["model_id"]
         if self.transit_months_left > 0:
             out["transit_months_left"] = self.transit_months_left
         if self.target_region is not None:
@@ -140,11 +160,11 @@ class Rig:
     def from_dict(cls, d: dict) -> Rig:
         return cls(
             id=d["id"],
-            rig_type=RigType(d["rig_type"]),
+            rig_type=_RIG_TYPE_BY_VALUE[d["rig_type"]],
             build_year=d["build_year"],
             condition=d["condition"],
-            region=Region(d["region"]),
-            state=RigState(d["state"]),
+            region=_REGION_BY_VALUE[d["region"]],
+            state=_RIG_STATE_BY_VALUE[d["state"]],
             on_contract_months_left=d.get("on_contract_months_left", 0),
             contract_dayrate=d.get("contract_dayrate", 0),
             contract_id=d.get("contract_id"),
@@ -152,34 +172,35 @@ class Rig:
             model_id=d.get("model_id"),
             company_id=d.get("company_id"),
             transit_months_left=d.get("transit_months_left", 0),
-            target_region=Region(d["target_region"]) if d.get("target_region") else None,
+            target_region=_REGION_BY_VALUE[d["target_region"]] if d.get("target_region") else None,
         )
 
     @property
     def is_available(self) -> bool:
-        return self.state == RigState.ACTIVE and self.on_contract_months_left == 0 and self.transit_months_left == 0
+        return self.state is _ACTIVE and self.on_contract_months_left == 0 and self.transit_months_left == 0
 
     def opex_per_day_k(self, current_year: int) -> int:
         """
         Very rough. You’ll tune this.
         """
-        base = 55 if self.rig_type == RigType.JACKUP else 95
+        base = 55 if self.rig_type is _JACKUP else 95
         age_years = max(0, current_year - self.build_year)
         age_penalty = max(0, age_years - 10) * 2
         condition_penalty = max(0, (70 - self.condition)) // 5
         return base + age_penalty + condition_penalty
 
     def stacking_cost_per_month_k(self) -> int:
-        if self.state == RigState.ACTIVE:
-            return 850 if self.rig_type == RigType.JACKUP else 1400
-        if self.state == RigState.WARM:
-            return 450 if self.rig_type == RigType.JACKUP else 750
-        if self.state == RigState.COLD:
+        state = self.state
+        if state is _ACTIVE:
+            return 850 if self.rig_type is _JACKUP else 1400
+        if state is _WARM:
+            return 450 if self.rig_type is _JACKUP else 750
+        if state is _COLD:
             return 180
         return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     id: int
     name: str
@@ -217,7 +238,7 @@ class Company:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RigForSale:
     rig: Rig
     price_musd: float
@@ -3,6 +3,16 @@ import random
 from typing import Optional
 from .models import Rig, RigType, Region, RigState, RigForSale
 
+_RIG_TYPES = tuple(RigType)
+_REGIONS = tuple(Region)
+# Base new-build-equivalent price (MUSD) by rig type
+_BASE_PRICE_MUSD = {
+    RigType.DRILLSHIP: 220.0,
+    RigType.SEMI: 150.0,
+    RigType.JACKUP: 60.0,
+}
+
+
 class RigMarketGenerator:
     def __init__(self, seed: int = 42):
         self.rng = random.Random(seed)
@@ -28,7 +38,7 @@ class RigMarketGenerator:
         return out, rid
 
     def _generate_one(self, rig_id: int, current_year: int, steel_price: float) -> RigForSale:
-        rtype = self.rng.choice(list(RigType))
+        rtype = self.rng.choice(_RIG_TYPES)
         
         # Build year: 5 to 35 years old
         age = self.rng.randint(5, 35)
@@ -38,7 +48,7 @@ class RigMarketGenerator:
         condition = self.rng.randint(30, 90)
         
         # Region: random
-        region = self.rng.choice(list(Region))
+        region = self.rng.choice(_REGIONS)
 
         rig = Rig(
             id=rig_id,
@@ -52,13 +62,8 @@ class RigMarketGenerator:
         )
 
         # Price logic: base + condition bonus - age penalty, scaled by steel
-        if rtype == RigType.DRILLSHIP:
-            base_price = 220.0
-        elif rtype == RigType.SEMI:
-            base_price = 150.0
-        else: # JACKUP
-            base_price = 60.0
-        
+        base_price = _BASE_PRICE_MUSD[rtype]
+
         # Age penalty: -2% per year
         age_factor = 1.0 - (age * 0.02)
         # Condition factor: 0.5 to 1.2
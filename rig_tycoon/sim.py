@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import csv
 from dataclasses import dataclass
+import json
 from pathlib import Path
 import random
-import pandas as pd
+import sys
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
 
 from .models import (
     Company, Rig, RigType, RigState, Region,
@@ -11,7 +20,7 @@ from .models import (
 )
 from .market import OilMarket, SteelMarket
 from .ai import AIPersonality, choose_bid
-from .contracts import ContractGenerator, Tender
+from .contracts import ContractGenerator, Tender, rig_matches_class
 from .rig_market import RigMarketGenerator
 
 
@@ -26,16 +35,49 @@ class SimConfig:
     seed: int = 7
     months: int = 36
     start_year: int = 2025
+    # print the per-month summary, player fleet table and save notices
+    verbose: bool = True
+    # write a full turn_<m>_state.json checkpoint every N months (0 = never)
+    checkpoint_every: int = 1
 
 
 # ======================
 # Simulation
 # ======================
 
+def _write_json(path: str | Path, obj, *, compact: bool = False) -> None:
+    """
+    Write obj as JSON, via orjson when it is installed.
+    Indented by default; compact drops all optional whitespace.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(path, "w") as f:
+            if compact:
+                json.dump(obj, f, separators=(",", ":"))
+            else:
+                json.dump(obj, f, indent=2)
+
+
+def _read_json(path: str | Path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+
+# Regions that put out tenders each month (generate_tick uses a tuple as-is)
+_TENDER_REGIONS = (Region.NORTH_SEA, Region.GOM)
+
+_MARKET_CSV_FIELDS = ("month", "oil_price", "steel_price", "demand_factor")
+_COMPANY_CSV_FIELDS = ("month", "company", "cash_musd", "rigs_active", "rigs_warm", "rigs_cold")
+
 class Sim:
     def __init__(self, cfg: SimConfig):
-        self.rng = random.Random(cfg.seed)
-        self.cfg = cfg
+        self._init_runtime(cfg)
         self.oil_market = OilMarket(rng=self.rng)
         self.steel_market = SteelMarket(rng=self.rng)
         self.contract_id_seq = 1
@@ -46,68 +88,124 @@ class Sim:
         self.player = self._make_player()
         self.ai_companies = self._make_ai()
         self.all_companies = [self.player] + self.ai_companies
+        self._companies_by_name = {c.name: c for c in self.all_companies}
+        self.ai_personalities = self._make_ai_personalities()
 
-        # AI personalities
-        self.ai_personalities = {
-            self.ai_companies[0].name: AIPersonality(
-                aggressiveness=0.75,
-                desperation=0.55,
-                quality_bias=0.2,
-            ),
-            self.ai_companies[1].name: AIPersonality(
-                aggressiveness=0.35,
-                desperation=0.25,
-                quality_bias=0.6,
-            ),
-        }
+    def _init_runtime(self, cfg: SimConfig) -> None:
+        """
+        State every Sim needs whether it is freshly generated or loaded:
+        rng, config, logging buffers and the (lazily created) output dir.
+        """
+        self.rng = random.Random(cfg.seed)
+        self.cfg = cfg
 
         # logging
         self.market_history: list[dict] = []
         self.company_history: list[dict] = []
+        # history CSVs are streamed row by row; opened on the first recorded month
+        self._csv_files: list = []
+        # set once the files exist; later opens append instead of truncating
+        self._history_csvs_started = False
+        self._market_csv: csv.DictWriter | None = None
+        self._company_csv: csv.DictWriter | None = None
         self.current_tenders: list[Tender] = []
+        self._tenders_by_id: dict[int, Tender] = {}
         self.current_rigs_for_sale: list[RigForSale] = []
         
-        timestamp = datetime.now().isoformat(timespec="seconds").replace(":", "-")
+        started = datetime.now()
+        # stamped into per-turn checkpoints; explicit saves use the time of the save
+        self._session_started_at = started.isoformat()
+        timestamp = started.strftime("%Y-%m-%dT%H-%M-%S")
         self.output_dir = Path("output") / timestamp
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # created on first write, so loading or building a Sim touches no disk
+        self._output_dir_ready = False
+        # per-turn files are encoded and written on a single background thread
+        self._io_pool: ThreadPoolExecutor | None = None
+        # (future, path to announce once written or None)
+        self._io_futures: deque[tuple[Future, Path | None]] = deque()
+
+    def _ensure_output_dir(self) -> None:
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
+
+    def _write_json_async(self, path: Path, obj, *, compact: bool = False, announce: bool = False) -> None:
+        """
+        Queue obj to be written by the background writer. obj must not be
+        mutated afterwards; callers hand over freshly built to_dict() output.
+        With announce, "saved" is printed once the write has completed.
+        """
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sim-io")
+        future = self._io_pool.submit(_write_json, path, obj, compact=compact)
+        self._io_futures.append((future, path if announce else None))
+
+    def _drain_writes(self) -> None:
+        """Wait for all queued writes, re-raising the first failure."""
+        while self._io_futures:
+            future, announce = self._io_futures.popleft()
+            future.result()
+            if announce is not None:
+                print(f"💾 Game saved to {announce}")
 
     # ======================
     # Save / Load
     # ======================
 
-    def to_dict(self) -> dict:
+    def _markets_dict(self) -> dict:
+        return {
+            "oil": self.oil_market.to_dict(),
+            "steel": self.steel_market.to_dict(),
+        }
+
+    def to_dict(
+        self,
+        *,
+        markets: dict | None = None,
+        companies: list[dict] | None = None,
+        rigs_for_sale: list[dict] | None = None,
+        created_at: str | None = None,
+    ) -> dict:
+        """
+        Full save state. The optional pieces let callers that already built
+        them this turn (see _save_turn_files) share them instead of rebuilding.
+        created_at defaults to when this session started.
+        """
+        if markets is None:
+            markets = self._markets_dict()
+        if companies is None:
+            companies = [c.to_dict() for c in self.all_companies]
+        if rigs_for_sale is None:
+            rigs_for_sale = [r.to_dict() for r in self.current_rigs_for_sale]
         return {
             "save_version": 1,
             "meta": {
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at or self._session_started_at,
                 "game_version": "0.1.0",
             },
             "rng_state": list(self.rng.getstate()),
             "time": {
                 "month": self.oil_market.month,
             },
-            "markets": {
-                "oil": self.oil_market.to_dict(),
-                "steel": self.steel_market.to_dict(),
-            },
+            "markets": markets,
             "rigs": [r.to_dict() for c in self.all_companies for r in c.rigs],
-            "companies": [c.to_dict() for c in self.all_companies],
+            "companies": companies,
             "contract_id_seq": self.contract_id_seq,
             "rig_id_seq": self.rig_id_seq,
-            "current_rigs_for_sale": [r.to_dict() for r in self.current_rigs_for_sale],
+            "current_rigs_for_sale": rigs_for_sale,
             "contract_gen": self.contract_gen.to_dict(),
             "rig_market_gen": self.rig_market_gen.to_dict(),
         }
 
     @classmethod
     def load(cls, path: str | Path) -> Sim:
-        import json
-        with open(path, "r") as f:
-            d = json.load(f)
+        d = _read_json(path)
 
-        # Create sim with dummy config, then overwrite
+        # Bare sim with a dummy config; everything world-related is filled from d
+        # rather than generated and then thrown away
         cfg = SimConfig(seed=0) # Seed will be overwritten by rng_state
-        sim = cls(cfg)
+        sim = cls.__new__(cls)
+        sim._init_runtime(cfg)
         
         state = d["rng_state"]
         # random.setstate expects a 3-tuple, where the second element is a tuple of 624 ints
@@ -126,8 +224,9 @@ class Sim:
         sim.contract_gen = ContractGenerator.from_dict(d["contract_gen"], sim.rng)
         if "rig_market_gen" in d:
             sim.rig_market_gen = RigMarketGenerator.from_dict(d["rig_market_gen"])
+        else:
+            sim.rig_market_gen = RigMarketGenerator(cfg.seed)
         
-        sim.current_rigs_for_sale = []
         if "current_rigs_for_sale" in d:
             from .models import RigForSale
             sim.current_rigs_for_sale = [RigForSale.from_dict(r) for r in d["current_rigs_for_sale"]]
@@ -139,48 +238,90 @@ class Sim:
         sim.all_companies = [Company.from_dict(c, rig_map) for c in d["companies"]]
         sim.player = next(c for c in sim.all_companies if c.name == "PlayerCo")
         sim.ai_companies = [c for c in sim.all_companies if c.name != "PlayerCo"]
+        sim._companies_by_name = {c.name: c for c in sim.all_companies}
+        sim.ai_personalities = sim._make_ai_personalities()
 
         return sim
 
-    def save(self, path: str | Path) -> None:
-        import json
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
-        print(f"💾 Game saved to {path}")
+    def save(self, path: str | Path, *, announce: bool = True) -> None:
+        _write_json(path, self.to_dict(created_at=datetime.now().isoformat()))
+        if announce:
+            print(f"💾 Game saved to {path}")
 
     # ======================
     # Logging
     # ======================
 
+    def _open_history_csvs(self) -> None:
+        self._ensure_output_dir()
+        resume = self._history_csvs_started
+        for attr, name, fields in (
+            ("_market_csv", "simulation_output_market.csv", _MARKET_CSV_FIELDS),
+            ("_company_csv", "simulation_output_company.csv", _COMPANY_CSV_FIELDS),
+        ):
+            f = open(self.output_dir / name, "a" if resume else "w", newline="")
+            self._csv_files.append(f)
+            writer = csv.DictWriter(f, fieldnames=fields, lineterminator="\n")
+            if not resume:
+                writer.writeheader()
+            setattr(self, attr, writer)
+        self._history_csvs_started = True
+
+    def _close_history_csvs(self) -> None:
+        for f in self._csv_files:
+            f.close()
+        self._csv_files = []
+        self._market_csv = None
+        self._company_csv = None
+
+    @staticmethod
+    def _rig_state_counts(company: Company) -> tuple[int, int, int]:
+        """
+        (on contract, warm idle, cold idle) rig counts in a single pass.
+        """
+        warm_state = RigState.WARM
+        cold_state = RigState.COLD
+        active = warm = cold = 0
+        for r in company.rigs:
+            months_left = r.on_contract_months_left
+            if months_left > 0:
+                active += 1
+            elif months_left == 0:
+                state = r.state
+                if state is warm_state:
+                    warm += 1
+                elif state is cold_state:
+                    cold += 1
+        return active, warm, cold
+
     def _record_month(self) -> None:
+        if self._market_csv is None:
+            self._open_history_csvs()
+
         # Market grain
-        self.market_history.append({
+        market_row = {
             "month": self.oil_market.month,
             "oil_price": round(self.oil_market.oil_price, 2),
             "steel_price": round(self.steel_market.steel_price, 2),
             "demand_factor": round(self.oil_market.demand_factor, 2),
-        })
+        }
+        self.market_history.append(market_row)
+        self._market_csv.writerow(market_row)
 
         # Company grain
         for c in self.all_companies:
-            active = sum(1 for r in c.rigs if r.on_contract_months_left > 0)
-            warm = sum(
-                1 for r in c.rigs
-                if r.on_contract_months_left == 0 and r.state == RigState.WARM
-            )
-            cold = sum(
-                1 for r in c.rigs
-                if r.on_contract_months_left == 0 and r.state == RigState.COLD
-            )
+            active, warm, cold = self._rig_state_counts(c)
 
-            self.company_history.append({
+            company_row = {
                 "month": self.oil_market.month,
                 "company": c.name,
                 "cash_musd": round(c.cash_musd, 2),
                 "rigs_active": active,
                 "rigs_warm": warm,
                 "rigs_cold": cold,
-            })
+            }
+            self.company_history.append(company_row)
+            self._company_csv.writerow(company_row)
 
     # ======================
     # Setup
@@ -276,6 +417,20 @@ class Sim:
         )
         return [a, b]
 
+    def _make_ai_personalities(self) -> dict[str, AIPersonality]:
+        return {
+            self.ai_companies[0].name: AIPersonality(
+                aggressiveness=0.75,
+                desperation=0.55,
+                quality_bias=0.2,
+            ),
+            self.ai_companies[1].name: AIPersonality(
+                aggressiveness=0.35,
+                desperation=0.25,
+                quality_bias=0.6,
+            ),
+        }
+
     # ======================
     # Contracts
     # ======================
@@ -287,12 +442,14 @@ class Sim:
 
     def _settle_month_cashflows(self) -> None:
         current_year = self.cfg.start_year + self.oil_market.month // 12
+        scrap_state = RigState.SCRAP
+        active_state = RigState.ACTIVE
         for c in self.all_companies:
             rev_musd = 0.0
             cost_musd = 0.0
 
             for r in c.rigs:
-                if r.state == RigState.SCRAP:
+                if r.state is scrap_state:
                     continue
 
                 if r.on_contract_months_left > 0:
@@ -302,7 +459,7 @@ class Sim:
                     r.on_contract_months_left -= 1
                     if r.on_contract_months_left == 0:
                         r.contract_dayrate = 0
-                        r.state = RigState.ACTIVE
+                        r.state = active_state
                         r.contract_id = None
                 else:
                     cost_musd += r.stacking_cost_per_month_k() / 1000.0
@@ -319,33 +476,40 @@ class Sim:
     def _award_contracts(self, tenders: list[Tender], player_bids: list[tuple[int, int, int]]) -> list[dict]:
         # Create a map for quick lookup
         p_bid_map: dict[int, tuple[int, int]] = {t_id: (r_id, rate) for t_id, r_id, rate in player_bids}
+        # Resolve each AI's personality and reputation penalty once rather than per tender
+        # (reputation doesn't change during an auction round)
+        ai_bidders = [
+            (ai, self.ai_personalities[ai.name], (1.0 - ai.reputation) * 4.0)
+            for ai in self.ai_companies
+        ]
+        player_rep_penalty = (1.0 - self.player.reputation) * 4.0
         awards = []
 
         for t in tenders:
-            bids: list[tuple[str, int, int]] = []
+            # Score bids as they come in and keep the lowest; strict < keeps the
+            # earliest bid on ties (player first, then AIs in order)
+            best: tuple[Company, int, int] | None = None
+            best_score = 0.0
 
-            if t.id in p_bid_map:
-                bids.append((self.player.name, *p_bid_map[t.id]))
+            player_bid = p_bid_map.get(t.id)
+            if player_bid is not None:
+                best_score = player_bid[1] + player_rep_penalty
+                best = (self.player, *player_bid)
 
-            for ai in self.ai_companies:
-                p = self.ai_personalities[ai.name]
+            for ai, p, rep_penalty in ai_bidders:
                 ai_bid = choose_bid(ai, p, t)
                 if ai_bid:
-                    bids.append((ai.name, *ai_bid))
+                    score = ai_bid[1] + rep_penalty
+                    if best is None or score < best_score:
+                        best_score = score
+                        best = (ai, *ai_bid)
 
-            if not bids:
+            if best is None:
                 continue
 
-            scored = []
-            for company_name, rig_id, dayrate in bids:
-                comp = next(x for x in self.all_companies if x.name == company_name)
-                rep_penalty = (1.0 - comp.reputation) * 4.0
-                scored.append((dayrate + rep_penalty, company_name, rig_id, dayrate))
-
-            scored.sort(key=lambda x: x[0])
-            _, winner, rig_id, dayrate = scored[0]
+            comp, rig_id, dayrate = best
+            winner = comp.name
 
-            comp = next(x for x in self.all_companies if x.name == winner)
             rig = next(r for r in comp.rigs if r.id == rig_id)
 
             rig.on_contract_months_left = t.spec.months
@@ -373,8 +537,8 @@ class Sim:
 
     def _get_company(self, name: str) -> Company:
         try:
-            return next(c for c in self.all_companies if c.name == name)
-        except StopIteration:
+            return self._companies_by_name[name]
+        except KeyError:
             raise ValueError(f"Company '{name}' not found. Known: {[c.name for c in self.all_companies]}")
 
     def _forecast_monthly_financials(self, company: Company) -> tuple[float, float]:
@@ -385,7 +549,7 @@ class Sim:
         revenue_musd = 0.0
         opex_musd = 0.0
         for r in company.rigs:
-            if r.state == RigState.SCRAP:
+            if r.state is RigState.SCRAP:
                 continue
             if r.on_contract_months_left > 0:
                 revenue_musd += (r.contract_dayrate * 30) / 1000.0
@@ -402,6 +566,12 @@ class Sim:
         """
         return [t.to_dict() for t in self.current_tenders]
 
+    def get_tender(self, tender_id: int) -> Tender | None:
+        """
+        Look up an open tender by id.
+        """
+        return self._tenders_by_id.get(tender_id)
+
     def get_company_fleet(self, company_name: str = "PlayerCo") -> list[dict]:
         """
         Snapshot of a company's rigs: specs, location, and live contract info.
@@ -490,32 +660,48 @@ class Sim:
     # Player bidding (auto)
     # ======================
 
-    def _player_auto_bid(self, tender: Contract) -> tuple[int, int] | None:
-        candidates = []
+    def _player_available_by_region(self) -> dict[Region, list[Rig]]:
+        """
+        Index the player's available rigs by region (fleet order preserved).
+        Nothing changes availability between bids within a turn, so this is
+        built once per turn rather than re-checked for every tender.
+        """
+        index: dict[Region, list[Rig]] = {}
         for r in self.player.rigs:
-            if not r.is_available:
-                continue
-            from .contracts import rig_matches_class
-            if not rig_matches_class(r.rig_type, tender.spec.rig_type):
-                continue
-            if r.region != tender.spec.region:
-                continue
-            if r.condition < tender.spec.min_condition:
-                continue
-            candidates.append(r)
-
-        if not candidates:
+            if r.is_available:
+                index.setdefault(r.region, []).append(r)
+        return index
+
+    def _player_auto_bid(
+        self,
+        tender: Contract,
+        available_by_region: dict[Region, list[Rig]] | None = None,
+    ) -> tuple[int, int] | None:
+        if available_by_region is None:
+            available_by_region = self._player_available_by_region()
+        spec = tender.spec
+        current_year = spec.start_date.year
+        # (opex, rig) pairs: opex is computed once per candidate and reused for breakeven;
+        # min() keeps the first of equal keys, as the stable sort did
+        best = min(
+            (
+                (r.opex_per_day_k(current_year), r)
+                for r in available_by_region.get(spec.region, ())
+                if rig_matches_class(r.rig_type, spec.rig_type)
+                and r.condition >= spec.min_condition
+            ),
+            key=lambda c: (c[0], -c[1].condition),
+            default=None,
+        )
+        if best is None:
             return None
-
-        current_year = tender.spec.start_date.year
-        candidates.sort(key=lambda r: (r.opex_per_day_k(current_year), -r.condition))
-        rig = candidates[0]
+        opex, rig = best
 
         softness = 1.0 - min(1.0, self.oil_market.demand_factor / 1.5)
         discount = int((0.08 + 0.22 * softness) * tender.spec.max_dayrate)
         dayrate = tender.spec.max_dayrate - discount
 
-        breakeven = rig.opex_per_day_k(current_year) + 12
+        breakeven = opex + 12
         if dayrate < breakeven - 8:
             return None
 
@@ -528,7 +714,6 @@ class Sim:
         if not rig.is_available:
             return False, f"Rig {rig.id} is not available (state={rig.state.value}, months_left={rig.on_contract_months_left})"
         
-        from .contracts import rig_matches_class
         if not rig_matches_class(rig.rig_type, tender.spec.rig_type):
             return False, f"Rig type {rig.rig_type.value} does not match required class {tender.spec.rig_type.name}"
         
@@ -567,6 +752,9 @@ class Sim:
         """
         Moves rig between ACTIVE, WARM, and COLD.
         """
+        # accept plain values ("warm") too; the stored state must be the member,
+        # since Rig compares states by identity
+        new_state = RigState(new_state)
         rig = next((r for r in self.player.rigs if r.id == rig_id), None)
         if not rig:
             return False, f"Rig {rig_id} not found in your fleet."
@@ -637,6 +825,7 @@ class Sim:
         """
         Starts mobilization to another region.
         """
+        target_region = Region(target_region)
         rig = next((r for r in self.player.rigs if r.id == rig_id), None)
         if not rig:
             return False, f"Rig {rig_id} not found in your fleet."
@@ -668,7 +857,7 @@ class Sim:
         # Max debt = 60% of total scrap value
         total_scrap = 0.0
         for r in self.player.rigs:
-            base = 8.0 if r.rig_type == RigType.DRILLSHIP else (5.0 if r.rig_type == RigType.SEMI else 2.5)
+            base = 8.0 if r.rig_type is RigType.DRILLSHIP else (5.0 if r.rig_type is RigType.SEMI else 2.5)
             condition_mult = 0.4 + (r.condition / 100.0) * 0.6
             payout = round(base * condition_mult, 1)
             total_scrap += payout
@@ -722,13 +911,14 @@ class Sim:
         as_of_date = date(year, month, 1)
 
         tenders, self.contract_id_seq = self.contract_gen.generate_tick(
-            regions=[Region.NORTH_SEA, Region.GOM],
+            regions=_TENDER_REGIONS,
             next_contract_id=self.contract_id_seq,
             as_of_date=as_of_date,
             oil_factor=self.oil_market.oil_factor,
             demand_factor=self.oil_market.demand_factor,
         )
         self.current_tenders = tenders
+        self._tenders_by_id = {t.id: t for t in tenders}
 
         # Generate new rigs for sale at the start of the turn
         year = self.cfg.start_year + (self.oil_market.month // 12)
@@ -765,26 +955,34 @@ class Sim:
         return awards
 
     def _save_turn_files(self, m: int, tenders: list[Tender], rigs_for_sale: list) -> None:
-        import json
-        turn_save = self.output_dir / f"turn_{m:02d}_state.json"
-        self.save(turn_save)
-
-        with open(self.output_dir / f"turn_{m:02d}_tenders.json", "w") as f:
-            json.dump([t.to_dict() for t in tenders], f, indent=2)
-
-        with open(self.output_dir / f"turn_{m:02d}_rigs_for_sale.json", "w") as f:
-            json.dump([r.to_dict() for r in rigs_for_sale], f, indent=2)
-
-        market_state = {
-            "oil": self.oil_market.to_dict(),
-            "steel": self.steel_market.to_dict(),
+        # last turn's files have had the whole turn to finish; collect them
+        # (and any write error) before queueing more
+        self._drain_writes()
+        self._ensure_output_dir()
+        # build each section once; the checkpoint and the turn file share them
+        markets = self._markets_dict()
+        companies = [c.to_dict() for c in self.all_companies]
+        rigs_for_sale_d = [r.to_dict() for r in rigs_for_sale]
+
+        every = self.cfg.checkpoint_every
+        if every > 0 and m % every == 0:
+            turn_save = self.output_dir / f"turn_{m:02d}_state.json"
+            state = self.to_dict(
+                markets=markets,
+                companies=companies,
+                rigs_for_sale=rigs_for_sale_d if rigs_for_sale is self.current_rigs_for_sale else None,
+            )
+            self._write_json_async(turn_save, state, announce=self.cfg.verbose)
+
+        # one compact file per turn instead of a file per section
+        turn = {
+            "month": m,
+            "tenders": [t.to_dict() for t in tenders],
+            "rigs_for_sale": rigs_for_sale_d,
+            "market": markets,
+            "companies": companies,
         }
-        with open(self.output_dir / f"turn_{m:02d}_market.json", "w") as f:
-            json.dump(market_state, f, indent=2)
-
-        companies_state = [c.to_dict() for c in self.all_companies]
-        with open(self.output_dir / f"turn_{m:02d}_companies.json", "w") as f:
-            json.dump(companies_state, f, indent=2)
+        self._write_json_async(self.output_dir / f"turn_{m:02d}.json", turn, compact=True)
 
     def run(self) -> None:
         """Original run loop for automation/testing"""
@@ -792,13 +990,15 @@ class Sim:
             tenders = self.prepare_turn()
             # In auto-run, player still auto-bids
             player_bids = []
+            available_by_region = self._player_available_by_region()
             for t in tenders:
-                bid = self._player_auto_bid(t)
+                bid = self._player_auto_bid(t, available_by_region)
                 if bid:
                     player_bids.append((t.id, *bid))
             
             self.resolve_turn(player_bids)
-            self._print_month_summary(tenders)
+            if self.cfg.verbose:
+                self._print_month_summary(tenders)
 
             if self.player.cash_musd <= 0:
                 print("\n💥 BANKRUPT. Game over.\n")
@@ -807,13 +1007,18 @@ class Sim:
         self.finalize()
 
     def finalize(self) -> None:
-        df_market = pd.DataFrame(self.market_history)
-        df_market.to_csv(self.output_dir / "simulation_output_market.csv", index=False)
-
-        df_company = pd.DataFrame(self.company_history)
-        df_company.to_csv(self.output_dir / "simulation_output_company.csv", index=False)
-
-        self.save(self.output_dir / "final_state.json")
+        # rows were streamed as each month was recorded; make sure the headers
+        # exist even for a zero-month run, then flush and close. A repeat
+        # finalize leaves the already-written files alone.
+        if not self._history_csvs_started:
+            self._open_history_csvs()
+        self._close_history_csvs()
+        self._drain_writes()
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
+
+        self.save(self.output_dir / "final_state.json", announce=self.cfg.verbose)
 
     # ======================
     # Output
@@ -821,37 +1026,35 @@ class Sim:
 
     def _print_month_summary(self, tenders: list[Contract]) -> None:
         m = self.oil_market.month
-        print(f"\n=== Month {m:02d} | Oil ${self.oil_market.oil_price:0.1f} | Steel ${self.steel_market.steel_price:0.0f} ===")
-        print(f"Tenders: {len(tenders)} | Demand Factor: {self.oil_market.demand_factor:0.2f}")
+        lines = [
+            f"\n=== Month {m:02d} | Oil ${self.oil_market.oil_price:0.1f} | Steel ${self.steel_market.steel_price:0.0f} ===",
+            f"Tenders: {len(tenders)} | Demand Factor: {self.oil_market.demand_factor:0.2f}",
+        ]
 
         for c in self.all_companies:
-            active = sum(1 for r in c.rigs if r.on_contract_months_left > 0)
-            warm = sum(
-                1 for r in c.rigs
-                if r.on_contract_months_left == 0 and r.state == RigState.WARM
-            )
-            cold = sum(
-                1 for r in c.rigs
-                if r.on_contract_months_left == 0 and r.state == RigState.COLD
-            )
-            print(
+            active, warm, cold = self._rig_state_counts(c)
+            lines.append(
                 f"- {c.name:18s} "
                 f"cash=${c.cash_musd:6.1f}m | "
                 f"rigs active={active} warm={warm} cold={cold}"
             )
-        self._print_player_fleet()
+        lines.extend(self._player_fleet_lines())
+        # one write for the whole summary instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _player_fleet_lines(self) -> list[str]:
+        lines = [
+            "\n🚢 Player Fleet Status:",
+            f"{'ID':<4} {'Type':<8} {'Location':<18} {'Status':<8} {'Opex':<10} {'Dayrate':<10} {'Schedule'}",
+            "-" * 80,
+        ]
 
-    def _print_player_fleet(self) -> None:
-        print("\n🚢 Player Fleet Status:")
-        print(f"{'ID':<4} {'Type':<8} {'Location':<18} {'Status':<8} {'Opex':<10} {'Dayrate':<10} {'Schedule'}")
-        print("-" * 80)
-        
         current_year = self.cfg.start_year + (self.oil_market.month // 12)
         for r in self.player.rigs:
             loc = f"{r.region.value[:10]} ({r.location_id})"
             status = r.state.value.upper()
             
-            if r.state == RigState.ACTIVE:
+            if r.state is RigState.ACTIVE:
                 opex = f"${r.opex_per_day_k(current_year)}k/d"
                 dayrate = f"${r.contract_dayrate}k/d"
                 schedule = f"{r.on_contract_months_left}m left"
@@ -860,4 +1063,5 @@ class Sim:
                 dayrate = "-"
                 schedule = "-"
             
-            print(f"{r.id:<4} {r.rig_type.value[:8]:<8} {loc:<18} {status:<8} {opex:<10} {dayrate:<10} {schedule}")
+            lines.append(f"{r.id:<4} {r.rig_type.value[:8]:<8} {loc:<18} {status:<8} {opex:<10} {dayrate:<10} {schedule}")
+        return lines
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from rig_tycoon.sim import Sim
+
+
+def _play(sim: Sim, months: int, *, auto_bid: bool = False) -> None:
+    """Play full prepare/resolve turns, optionally auto-bidding like Sim.run."""
+    for _ in range(months):
+        tenders = sim.prepare_turn()
+        player_bids = []
+        if auto_bid:
+            available_by_region = sim._player_available_by_region()
+            for t in tenders:
+                bid = sim._player_auto_bid(t, available_by_region)
+                if bid:
+                    player_bids.append((t.id, *bid))
+        sim.resolve_turn(player_bids)
+
+
+@pytest.fixture
+def play():
+    return _play
@@ -0,0 +1,92 @@
+import copy
+import random
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from rig_tycoon.contracts import ContractGenConfig, ContractGenerator, ContractType
+from rig_tycoon.ai import AIPersonality, choose_bid
+from rig_tycoon.models import Company, Region, Rig, RigState
+
+
+def test_config_defaults_are_per_instance():
+    cfg = ContractGenConfig()
+    clone = copy.deepcopy(cfg)
+    cfg.type_weights[ContractType.WORKOVER] = 1.0
+
+    assert clone.type_weights[ContractType.WORKOVER] == 0.25
+    assert ContractGenConfig().type_weights[ContractType.WORKOVER] == 0.25
+
+
+def _tenders(gen: ContractGenerator, ticks: int = 12) -> list:
+    out, cid = [], 1
+    for m in range(ticks):
+        tenders, cid = gen.generate_tick(
+            regions=(Region.NORTH_SEA, Region.GOM),
+            next_contract_id=cid,
+            as_of_date=date(2025, 1 + m, 1),
+            demand_factor=1.8,
+        )
+        out += [t.to_dict() for t in tenders]
+    return out
+
+
+def test_config_edits_apply_from_next_tick():
+    # reassigned fields and in-place dict edits both reach the generator
+    edited = ContractGenerator(random.Random(5))
+    edited.cfg.harsh_mult = 2.0
+    edited.cfg.type_weights[ContractType.WORKOVER] = 0.0
+    edited.cfg.water_depth_triangular_m[ContractType.DEVELOPMENT] = (40, 90, 200)
+
+    weights = dict(ContractGenConfig().type_weights)
+    weights[ContractType.WORKOVER] = 0.0
+    depths = dict(ContractGenConfig().water_depth_triangular_m)
+    depths[ContractType.DEVELOPMENT] = (40, 90, 200)
+    built = ContractGenerator(
+        random.Random(5),
+        ContractGenConfig(harsh_mult=2.0, type_weights=weights, water_depth_triangular_m=depths),
+    )
+
+    tenders = _tenders(edited)
+    assert tenders
+    assert tenders == _tenders(built)
+    assert all(t["spec"]["contract_type"] != "WORKOVER" for t in tenders)
+
+
+def test_degenerate_water_depth_triangle():
+    depths = {ctype: (50, 50, 50) for ctype in ContractType}
+    gen = ContractGenerator(random.Random(9), ContractGenConfig(water_depth_triangular_m=depths))
+    ref = random.Random(9)
+    for ctype in ContractType:
+        assert gen._water_depth(ctype) == int(ref.triangular(50, 50, 50)) == 50
+    # one draw per depth, like random.triangular, so the seeded stream is unchanged
+    assert gen.rng.getstate() == ref.getstate()
+    assert all(t["spec"]["water_depth_m"] == 50 for t in _tenders(gen))
+
+
+def test_plain_region_values_are_coerced():
+    # tenders and rigs built from plain values must still match in the AI's
+    # identity-based filters and in the sim's == checks alike
+    tenders = _tenders(ContractGenerator(random.Random(2)))
+    gen = ContractGenerator(random.Random(2))
+    tenders_plain, cid = [], 1
+    for m in range(12):
+        batch, cid = gen.generate_tick(
+            regions=["north_sea", "gom"],
+            next_contract_id=cid,
+            as_of_date=date(2025, 1 + m, 1),
+            demand_factor=1.8,
+        )
+        tenders_plain += batch
+    assert [t.to_dict() for t in tenders_plain] == tenders
+    assert all(isinstance(t.spec.region, Region) for t in tenders_plain)
+
+    rig = Rig(id=1, rig_type="jackup", build_year=2020, condition=90, region="north_sea", state="active")
+    assert rig.region is Region.NORTH_SEA and rig.state is RigState.ACTIVE and rig.is_available
+    company = Company(id=1, name="Co", cash_musd=100.0, rigs=[rig])
+    tender = next(t for t in tenders_plain if t.spec.region is Region.NORTH_SEA and t.spec.rig_type.name == "JACKUP")
+    bid = choose_bid(company, AIPersonality(0.5, 0.5, 0.5), tender)
+    assert bid is not None and bid[0] == rig.id
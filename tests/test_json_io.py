@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from rig_tycoon import sim as sim_module
+from rig_tycoon.sim import Sim, SimConfig, _read_json, _write_json
+
+_DATA = {"month": 3, "cash": 12.5, "rigs": [{"id": 1, "model_id": None}], "ok": True}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(sim_module, "orjson", orjson)
+    else:
+        monkeypatch.setattr(sim_module, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_json_roundtrip(json_backend, compact, tmp_path):
+    path = tmp_path / "data.json"
+    _write_json(path, _DATA, compact=compact)
+    assert _read_json(path) == _DATA
+    text = path.read_text()
+    assert ("\n" in text) is not compact
+
+
+def test_save_load_roundtrip(json_backend, tmp_path, monkeypatch, play):
+    monkeypatch.chdir(tmp_path)
+    sim = Sim(SimConfig(seed=5, verbose=False))
+    play(sim, 3)
+    sim.finalize()
+
+    loaded = Sim.load(sim.output_dir / "final_state.json")
+    expected = sim.to_dict()
+    actual = loaded.to_dict()
+    expected.pop("meta")
+    actual.pop("meta")
+    assert actual == expected
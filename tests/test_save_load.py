@@ -2,12 +2,14 @@ import sys
 import os
 from pathlib import Path
 import json
+import tempfile
 from datetime import date
 
 # Add project root to sys.path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from rig_tycoon.sim import Sim, SimConfig
+from rig_tycoon.models import Region
 
 def test_save_load():
     print("🚀 Starting Save/Load Determinism Test...")
@@ -15,6 +17,9 @@ def test_save_load():
     # 1. Initialize Sim with fixed seed
     cfg = SimConfig(seed=42, months=10)
     sim1 = Sim(cfg)
+    # history CSVs stream into output_dir; keep them out of the working tree
+    tmp = tempfile.TemporaryDirectory()
+    sim1.output_dir = Path(tmp.name) / "sim1"
     
     test_date = date(2025, 1, 1)
     
@@ -25,13 +30,13 @@ def test_save_load():
         sim1.steel_market.step_month()
         # Use regions that the generator expects
         tenders, sim1.contract_id_seq = sim1.contract_gen.generate_tick(
-            regions=["NORTH_SEA", "GOM"],
+            regions=[Region.NORTH_SEA, Region.GOM],
             next_contract_id=sim1.contract_id_seq,
             as_of_date=test_date,
             oil_factor=sim1.oil_market.oil_factor,
             demand_factor=sim1.oil_market.demand_factor,
         )
-        sim1._award_contracts(tenders)
+        sim1._award_contracts(tenders, [])
         sim1._settle_month_cashflows()
         sim1._record_month()
     
@@ -42,6 +47,7 @@ def test_save_load():
     # 4. Load state into Sim 2
     print("\n--- Loading Sim 2 from save ---")
     sim2 = Sim.load(save_path)
+    sim2.output_dir = Path(tmp.name) / "sim2"
     
     # 5. Run both for another 5 months
     print("\n--- Continuing both simulations for 5 more months ---")
@@ -50,13 +56,13 @@ def test_save_load():
         sim1.oil_market.step_month()
         sim1.steel_market.step_month()
         tenders1, sim1.contract_id_seq = sim1.contract_gen.generate_tick(
-            regions=["NORTH_SEA", "GOM"],
+            regions=[Region.NORTH_SEA, Region.GOM],
             next_contract_id=sim1.contract_id_seq,
             as_of_date=test_date,
             oil_factor=sim1.oil_market.oil_factor,
             demand_factor=sim1.oil_market.demand_factor,
         )
-        sim1._award_contracts(tenders1)
+        sim1._award_contracts(tenders1, [])
         sim1._settle_month_cashflows()
         sim1._record_month()
         
@@ -64,13 +70,13 @@ def test_save_load():
         sim2.oil_market.step_month()
         sim2.steel_market.step_month()
         tenders2, sim2.contract_id_seq = sim2.contract_gen.generate_tick(
-            regions=["NORTH_SEA", "GOM"],
+            regions=[Region.NORTH_SEA, Region.GOM],
             next_contract_id=sim2.contract_id_seq,
             as_of_date=test_date,
             oil_factor=sim2.oil_market.oil_factor,
             demand_factor=sim2.oil_market.demand_factor,
         )
-        sim2._award_contracts(tenders2)
+        sim2._award_contracts(tenders2, [])
         sim2._settle_month_cashflows()
         sim2._record_month()
         
@@ -85,9 +91,39 @@ def test_save_load():
     print("\n✨ ALL TESTS PASSED! Save/Load is perfectly deterministic.")
     
     # Cleanup
+    sim1._close_history_csvs()
+    sim2._close_history_csvs()
+    tmp.cleanup()
     if os.path.exists(save_path):
         os.remove(save_path)
 
+
+def _state(sim: Sim) -> dict:
+    d = sim.to_dict()
+    d.pop("meta")
+    return d
+
+
+def test_save_load_continue_turns(tmp_path, monkeypatch, play):
+    # full prepare/resolve turns through a save and a Sim.load, which rebuilds
+    # the sim from the save alone; both copies must then play out identically
+    monkeypatch.chdir(tmp_path)
+    sim1 = Sim(SimConfig(seed=7, verbose=False))
+    play(sim1, 6, auto_bid=True)
+    sim1.save(tmp_path / "mid.json")
+
+    sim2 = Sim.load(tmp_path / "mid.json")
+    sim2.output_dir = tmp_path / "loaded"
+    assert _state(sim2) == _state(sim1)
+
+    play(sim1, 6, auto_bid=True)
+    play(sim2, 6, auto_bid=True)
+    assert _state(sim2) == _state(sim1)
+    assert sim2.market_history == sim1.market_history[6:]
+    assert sim2.company_history == sim1.company_history[-len(sim2.company_history):]
+    sim1.finalize()
+    sim2.finalize()
+
 if __name__ == "__main__":
     try:
         test_save_load()
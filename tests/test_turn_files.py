@@ -0,0 +1,80 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to sys.path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from rig_tycoon.sim import Sim, SimConfig
+
+
+def test_checkpoint_every(tmp_path, monkeypatch, play):
+    monkeypatch.chdir(tmp_path)
+    sim = Sim(SimConfig(seed=3, verbose=False, checkpoint_every=2))
+    play(sim, 5)
+    sim._drain_writes()
+
+    out = sim.output_dir
+    months = range(1, sim.oil_market.month + 1)
+    assert sorted(p.name for p in out.glob("turn_??.json")) == [f"turn_{m:02d}.json" for m in months]
+    assert sorted(p.name for p in out.glob("turn_*_state.json")) == [
+        f"turn_{m:02d}_state.json" for m in months if m % 2 == 0
+    ]
+
+    # turn files are complete once drained
+    last = json.loads((out / f"turn_{sim.oil_market.month:02d}.json").read_text())
+    assert last["month"] == sim.oil_market.month
+    assert [c["name"] for c in last["companies"]] == [c.name for c in sim.all_companies]
+    sim.finalize()
+
+
+def test_checkpoint_matches_to_dict(tmp_path, monkeypatch, play):
+    monkeypatch.chdir(tmp_path)
+    sim = Sim(SimConfig(seed=3, verbose=False))
+    play(sim, 4)
+    sim._drain_writes()
+
+    saved = json.loads((sim.output_dir / f"turn_{sim.oil_market.month:02d}_state.json").read_text())
+    expected = json.loads(json.dumps(sim.to_dict()))
+    saved.pop("meta")
+    expected.pop("meta")
+    assert saved == expected
+    sim.finalize()
+
+
+def test_checkpoints_disabled(tmp_path, monkeypatch, play):
+    monkeypatch.chdir(tmp_path)
+    sim = Sim(SimConfig(seed=3, verbose=False, checkpoint_every=0))
+    play(sim, 3)
+    sim.finalize()
+    assert not list(sim.output_dir.glob("turn_*_state.json"))
+    assert len(list(sim.output_dir.glob("turn_??.json"))) == 3
+
+
+def test_drain_writes_reraises_failed_write(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sim = Sim(SimConfig(seed=3, verbose=False))
+    sim._write_json_async(tmp_path / "missing" / "x.json", {"a": 1})
+    with pytest.raises(OSError):
+        sim._drain_writes()
+    # the failure is reported once; later writes go through
+    sim._write_json_async(tmp_path / "ok.json", {"a": 1})
+    sim._drain_writes()
+    assert json.loads((tmp_path / "ok.json").read_text()) == {"a": 1}
+    sim.finalize()
+
+
+def test_save_announced_after_write(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    sim = Sim(SimConfig(seed=3, verbose=False))
+    path = tmp_path / "x.json"
+    sim._write_json_async(path, {"a": 1}, announce=True)
+    sim._write_json_async(tmp_path / "missing" / "y.json", {"a": 1}, announce=True)
+    with pytest.raises(OSError):
+        sim._drain_writes()
+    # only the write that landed is reported
+    assert capsys.readouterr().out == f"💾 Game saved to {path}\n"
+    assert path.exists()
+    sim.finalize()